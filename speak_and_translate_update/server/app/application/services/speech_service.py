@@ -136,7 +136,15 @@ class SpeechService:
             "audio/mp4", "audio/x-m4a"
         ]
         
-        self.translation_service = TranslationService()
+        self._translation_service = None
+        self._supported_languages = None
+
+    @property
+    def translation_service(self) -> TranslationService:
+        """TranslationService is created on first use; it loads the spell checker and TTS engine"""
+        if self._translation_service is None:
+            self._translation_service = TranslationService()
+        return self._translation_service
 
     def _get_language_config(self, mother_tongue: str) -> dict:
         """Get language configuration for the specified mother tongue"""
@@ -449,15 +457,18 @@ class SpeechService:
 
     def get_supported_languages(self) -> dict:
         """Return dictionary of supported languages and their configurations"""
-        return {
-            lang: {
-                'display_name': config['display_name'],
-                'azure_code': config['azure_code'],
-                'google_code': config['google_code'],
-                'wake_words': config['wake_words']
+        # language_configs is fixed after __init__, so build the summary once
+        if self._supported_languages is None:
+            self._supported_languages = {
+                lang: {
+                    'display_name': config['display_name'],
+                    'azure_code': config['azure_code'],
+                    'google_code': config['google_code'],
+                    'wake_words': config['wake_words']
+                }
+                for lang, config in self.language_configs.items()
             }
-            for lang, config in self.language_configs.items()
-        }
+        return self._supported_languages
 
     async def detect_language_from_audio(self, audio_path: str) -> str:
         """
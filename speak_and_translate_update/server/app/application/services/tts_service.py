@@ -12,6 +12,7 @@ import re
 import logging
 import time
 import random
+import uuid
 import requests
 import aiohttp
 
@@ -405,7 +406,7 @@ class EnhancedTTSService:
             if not output_path:
                 temp_dir = self._get_temp_directory()
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_path = os.path.join(temp_dir, f"multi_style_{timestamp}.mp3")
+                output_path = os.path.join(temp_dir, f"multi_style_{timestamp}_{uuid.uuid4().hex[:8]}.mp3")
 
             logger.info(f"🌐 Generating MULTI-STYLE audio for source language: {source_lang}")
             
@@ -939,7 +940,7 @@ class EnhancedTTSService:
             if not output_path:
                 temp_dir = self._get_temp_directory()
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_path = os.path.join(temp_dir, f"speech_{timestamp}.mp3")
+                output_path = os.path.join(temp_dir, f"speech_{timestamp}_{uuid.uuid4().hex[:8]}.mp3")
 
             success = await self._synthesize_with_retry(ssml, output_path)
             return os.path.basename(output_path) if success else None
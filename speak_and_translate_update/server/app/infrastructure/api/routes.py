@@ -2,32 +2,53 @@
 
 import asyncio
 import logging
+import re
 import tempfile
+import time
 import os
+import shutil
+import aiofiles.os
+import orjson
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, UploadFile, File
-from fastapi.responses import FileResponse, JSONResponse
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, Dict, Any, List, Tuple
 from ...application.services.speech_service import SpeechService
 from ...application.services.enhanced_translation_service import EnhancedTranslationService
 from ...application.services.translation_service import TranslationService
 from ...domain.entities.translation import Translation
+from ..log_batching import BufferedFileHandler, configure_logging
 
 # Configure enhanced logging for perfect sync debugging-----------------------
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("perfect_sync_api.log", encoding='utf-8')
-    ]
+# Request coroutines only enqueue records; the blocking stream/file handlers live
+# on a QueueListener thread. app/main.py configures that pipeline before importing
+# this module, so the setup here only runs when the app is served directly.
+_LOG_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
 )
+if not logging.getLogger().handlers:
+    _log_handlers = (
+        logging.StreamHandler(),
+        BufferedFileHandler("perfect_sync_api.log", encoding='utf-8', delay=True)
+    )
+    for _handler in _log_handlers:
+        _handler.setFormatter(_LOG_FORMATTER)
+    configure_logging(*_log_handlers)
 logger = logging.getLogger(__name__)
 
+# Log separators, built once instead of on every request
+_BANNER = "🎯" + "=" * 80
+_SEP = "=" * 60
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic with perfect sync info
@@ -41,17 +62,34 @@ async def lifespan(app: FastAPI):
     logger.info("   5. Perfect validation: Zero discrepancies allowed")
     logger.info("   6. Multi-Style Support: Multiple simultaneous translation styles")
     
+    # Create the audio directory once instead of on every health probe
+    try:
+        os.makedirs(AUDIO_DIR, exist_ok=True)
+        if os.name != "nt":
+            os.chmod(AUDIO_DIR, 0o755)
+    except Exception as e:
+        logger.warning(f"Could not create audio directory: {str(e)}")
+    
+    # Backpressure limits for translation and speech calls
+    global _translation_semaphore, _speech_semaphore
+    _translation_semaphore = asyncio.Semaphore(_MAX_INFLIGHT_TRANSLATIONS)
+    _speech_semaphore = asyncio.Semaphore(_MAX_INFLIGHT_SPEECH)
+    
     yield  # App runs here
     
     # Shutdown logic
     logger.info("Shutting down Perfect UI-Audio Sync Translation API")
+    _translation_semaphore = None
+    _speech_semaphore = None
 
 app = FastAPI(
     title="Perfect UI-Audio Sync Translation API with Multi-Style",
     description="GUARANTEED perfect synchronization between UI display and audio output with multiple style support",
     version="4.0-MULTI-STYLE",
     root_path="",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -63,6 +101,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class _JSONGZipMiddleware(GZipMiddleware):
+    """GZip the JSON endpoints but pass already-compressed audio straight through"""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/api/audio/"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+app.add_middleware(_JSONGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize services with neural enhancement and high-speed optimization
 from ...application.services.enhanced_translation_service import enhanced_translation_service
 from ...application.services.high_speed_optimizer import high_speed_optimizer
@@ -104,6 +153,106 @@ async def optimized_translation_process(text, source_lang, target_lang, style_pr
             mother_tongue=mother_tongue
         )
 
+AUDIO_DIR = "/tmp/tts_audio" if os.name != "nt" else os.path.join(os.environ.get("TEMP", ""), "tts_audio")
+
+# LRU cache of completed translations for repeated phrases. Lookups and inserts
+# never await, so they cannot interleave on the event loop and need no lock.
+_TRANSLATION_CACHE_SIZE = 512
+_translation_cache: "OrderedDict[Tuple, Translation]" = OrderedDict()
+
+def _translation_cache_key(prompt: "PromptRequest", mother_tongue: str) -> Tuple:
+    """Build a hashable cache key from the request text, languages and style preferences"""
+    return (
+        prompt.text,
+        prompt.source_lang or "auto",
+        prompt.target_lang or "multi",
+        mother_tongue,
+        tuple(prompt.style_preferences.model_dump().items())
+    )
+
+def _get_cached_translation(key: Tuple) -> Optional[Translation]:
+    """Return a cached translation if its audio file is still on disk"""
+    cached = _translation_cache.get(key)
+    if cached is None:
+        return None
+    if not os.path.exists(os.path.join(AUDIO_DIR, cached.audio_path)):
+        del _translation_cache[key]
+        return None
+    _translation_cache.move_to_end(key)
+    return cached
+
+def _cache_translation(key: Tuple, translation: Translation):
+    """Cache a translation; only results with audio are kept so fallbacks never stick"""
+    if not translation.audio_path:
+        return
+    _translation_cache[key] = translation
+    _translation_cache.move_to_end(key)
+    if len(_translation_cache) > _TRANSLATION_CACHE_SIZE:
+        _translation_cache.popitem(last=False)
+
+# Identical concurrent /api/conversation requests share one in-flight translation.
+# An entry lives only while its translation runs; finished results are served
+# from _translation_cache instead.
+_inflight_translations: Dict[Tuple, asyncio.Future] = {}
+
+# Backpressure: cap concurrent translations and speech recognitions so a traffic
+# spike queues here instead of piling onto Gemini/Azure. Created in lifespan().
+_MAX_INFLIGHT_TRANSLATIONS = int(os.environ.get("MAX_INFLIGHT_TRANSLATIONS", "8"))
+_MAX_INFLIGHT_SPEECH = int(os.environ.get("MAX_INFLIGHT_SPEECH", "8"))
+_translation_semaphore: Optional[asyncio.Semaphore] = None
+_speech_semaphore: Optional[asyncio.Semaphore] = None
+
+async def _run_limited(semaphore: Optional[asyncio.Semaphore], func, *args):
+    """Await func(*args) under the given semaphore, or directly if lifespan has not created it"""
+    if semaphore is None:
+        return await func(*args)
+    async with semaphore:
+        return await func(*args)
+
+# Upper bound for one translation while it holds a semaphore slot (matches the optimizer's timeout)
+_TRANSLATION_TIMEOUT = 60.0
+
+async def _translate(kwargs: Dict[str, Any]) -> Translation:
+    """Run one translation through the high-speed optimizer, bounded so a hung call frees its slot"""
+    try:
+        return await asyncio.wait_for(optimized_translation_process(**kwargs), _TRANSLATION_TIMEOUT)
+    except asyncio.TimeoutError:
+        # Every request sharing this translation gets the fallback response in start_conversation
+        raise asyncio.TimeoutError(f"Translation timed out after {_TRANSLATION_TIMEOUT:g}s") from None
+
+async def shared_translation_process(cache_key: Tuple, **kwargs) -> Translation:
+    """Translate under the backpressure limit, joining an identical translation already in flight"""
+    future = _inflight_translations.get(cache_key)
+    if future is None:
+        future = asyncio.ensure_future(_run_limited(_translation_semaphore, _translate, kwargs))
+        _inflight_translations[cache_key] = future
+        future.add_done_callback(lambda _: _inflight_translations.pop(cache_key, None))
+    # Shielded so one disconnecting client does not cancel the translation for the others
+    return await asyncio.shield(future)
+
+_VALID_MOTHER_TONGUES = frozenset({'spanish', 'english', 'german', 'french', 'italian', 'portuguese'})
+
+@lru_cache(maxsize=64)
+def _normalize_mother_tongue(mother_tongue: str) -> Optional[str]:
+    """Normalize mother tongue input, returning None if it is not supported"""
+    normalized = mother_tongue.lower().strip()
+    return normalized if normalized in _VALID_MOTHER_TONGUES else None
+
+@lru_cache(maxsize=64)
+def _warn_invalid_mother_tongue(mother_tongue: str):
+    """Warn about an unsupported mother tongue once per distinct value"""
+    logger.warning("Invalid mother tongue '%s', defaulting to Spanish", mother_tongue)
+
+def _validate_mother_tongue(mother_tongue: str) -> str:
+    """Validate and normalize mother tongue input"""
+    normalized = _normalize_mother_tongue(mother_tongue)
+    
+    if normalized is None:
+        _warn_invalid_mother_tongue(mother_tongue)
+        return 'spanish'
+    
+    return normalized
+
 class TranslationStylePreferences(BaseModel):
     """Translation style preferences with perfect sync and multi-style support"""
     # German styles - ALL can be selected simultaneously
@@ -122,10 +271,44 @@ class TranslationStylePreferences(BaseModel):
     german_word_by_word: bool = Field(False, alias="germanWordByWord")
     english_word_by_word: bool = Field(False, alias="englishWordByWord")
     
-    # Mother tongue for dynamic translation
+    # Mother tongue for dynamic translation, normalized while the request is parsed
     mother_tongue: Optional[str] = Field("spanish", alias="motherTongue")
     
-    model_config = {"populate_by_name": True}
+    # Built on every request: reject unknown keys up front and skip re-validation on the
+    # attribute writes made by _apply_intelligent_defaults
+    model_config = ConfigDict(
+        populate_by_name=True,
+        extra='forbid',
+        validate_assignment=False,
+        frozen=False
+    )
+    
+    @field_validator('mother_tongue', mode='before')
+    @classmethod
+    def _normalize_mother_tongue_field(cls, value):
+        """Lower-case and validate the mother tongue, falling back to Spanish"""
+        if not value:
+            return 'spanish'
+        if not isinstance(value, str):
+            return value
+        return _validate_mother_tongue(value)
+    
+    @property
+    def has_german_style(self) -> bool:
+        """Whether at least one German style is selected (short-circuits)"""
+        return (self.german_native or self.german_colloquial
+                or self.german_informal or self.german_formal)
+    
+    @property
+    def has_english_style(self) -> bool:
+        """Whether at least one English style is selected (short-circuits)"""
+        return (self.english_native or self.english_colloquial
+                or self.english_informal or self.english_formal)
+    
+    @property
+    def has_any_style(self) -> bool:
+        """Whether any German or English style is selected (short-circuits)"""
+        return self.has_german_style or self.has_english_style
 
 class PromptRequest(BaseModel):
     text: str
@@ -133,34 +316,26 @@ class PromptRequest(BaseModel):
     target_lang: Optional[str] = "multi"
     style_preferences: Optional[TranslationStylePreferences] = Field(None, alias="stylePreferences")
     
-    model_config = {"populate_by_name": True}
+    model_config = ConfigDict(populate_by_name=True)
 
-def _validate_mother_tongue(mother_tongue: str) -> str:
-    """Validate and normalize mother tongue input"""
-    valid_languages = ['spanish', 'english', 'german', 'french', 'italian', 'portuguese']
-    normalized = mother_tongue.lower().strip()
-    
-    if normalized not in valid_languages:
-        logger.warning(f"Invalid mother tongue '{mother_tongue}', defaulting to Spanish")
-        return 'spanish'
-    
-    return normalized
+class BatchPromptRequest(BaseModel):
+    prompts: List[PromptRequest] = Field(..., min_length=1, max_length=32)
 
 def _count_selected_styles(style_preferences: TranslationStylePreferences) -> Dict[str, int]:
     """Count how many styles are selected for each language"""
-    german_count = sum([
+    german_count = sum((
         style_preferences.german_native,
         style_preferences.german_colloquial,
         style_preferences.german_informal,
         style_preferences.german_formal
-    ])
+    ))
     
-    english_count = sum([
+    english_count = sum((
         style_preferences.english_native,
         style_preferences.english_colloquial,
         style_preferences.english_informal,
         style_preferences.english_formal
-    ])
+    ))
     
     return {
         'german': german_count,
@@ -168,68 +343,74 @@ def _count_selected_styles(style_preferences: TranslationStylePreferences) -> Di
         'total': german_count + english_count
     }
 
-def _apply_intelligent_defaults(style_preferences: TranslationStylePreferences) -> TranslationStylePreferences:
-    """Apply intelligent defaults based on mother tongue if no styles selected"""
-    mother_tongue = _validate_mother_tongue(style_preferences.mother_tongue or 'spanish')
-    
-    # Count selected styles
-    style_counts = _count_selected_styles(style_preferences)
+def _log_style_flags(style_preferences: TranslationStylePreferences, prefix: str = ""):
+    """Log the individual style flags (callers check isEnabledFor first)"""
+    logger.info("   %sGerman native: %s", prefix, style_preferences.german_native)
+    logger.info("   %sGerman formal: %s", prefix, style_preferences.german_formal)
+    logger.info("   %sGerman colloquial: %s", prefix, style_preferences.german_colloquial)
+    logger.info("   %sEnglish native: %s", prefix, style_preferences.english_native)
+    logger.info("   %sEnglish formal: %s", prefix, style_preferences.english_formal)
+    logger.info("   %sEnglish colloquial: %s", prefix, style_preferences.english_colloquial)
+
+# Mother tongue -> (german_colloquial, english_colloquial, description) applied when no style is selected
+_DEFAULT_STYLES_BY_TONGUE = {
+    'spanish': (True, True, "German + English colloquial"),
+    'english': (True, False, "German colloquial (Spanish automatic)"),
+    'german': (False, True, "English colloquial (Spanish automatic)"),
+}
+_DEFAULT_STYLES_OTHER = (True, True, "German + English colloquial")
+
+def _apply_intelligent_defaults(style_preferences: TranslationStylePreferences, mother_tongue: str) -> TranslationStylePreferences:
+    """Apply intelligent defaults based on the (already validated) mother tongue if no styles selected"""
+    # Short-circuits on the first selected style instead of counting all of them
+    has_any_style = style_preferences.has_any_style
+    log_info = logger.isEnabledFor(logging.INFO)
     
-    logger.info(f"🔍 DEFAULTS DEBUG: Before processing:")
-    logger.info(f"   Total styles: {style_counts['total']}")
-    logger.info(f"   German native: {style_preferences.german_native}")
-    logger.info(f"   German formal: {style_preferences.german_formal}")
-    logger.info(f"   German colloquial: {style_preferences.german_colloquial}")
-    logger.info(f"   English native: {style_preferences.english_native}")
-    logger.info(f"   English formal: {style_preferences.english_formal}")
-    logger.info(f"   English colloquial: {style_preferences.english_colloquial}")
+    if log_info:
+        logger.info("🔍 DEFAULTS DEBUG: Before processing:")
+        logger.info("   Any styles selected: %s", has_any_style)
+        _log_style_flags(style_preferences)
     
     # Apply defaults only if NO styles are selected
-    if style_counts['total'] == 0:
-        logger.info(f"🎯 No styles selected - applying defaults for mother tongue: {mother_tongue}")
+    if not has_any_style:
+        logger.info("🎯 No styles selected - applying defaults for mother tongue: %s", mother_tongue)
         
-        if mother_tongue == "spanish":
-            style_preferences.german_colloquial = True
-            style_preferences.english_colloquial = True
-            logger.info("   ✅ Spanish defaults: German + English colloquial")
-        elif mother_tongue == "english":
-            style_preferences.german_colloquial = True
-            logger.info("   ✅ English defaults: German colloquial (Spanish automatic)")
-        elif mother_tongue == "german":
-            style_preferences.english_colloquial = True
-            logger.info("   ✅ German defaults: English colloquial (Spanish automatic)")
-        else:
-            style_preferences.german_colloquial = True
-            style_preferences.english_colloquial = True
-            logger.info(f"   ✅ {mother_tongue} defaults: German + English colloquial")
-    else:
-        logger.info(f"🎯 User selected {style_counts['total']} specific styles")
+        german_colloquial, english_colloquial, description = _DEFAULT_STYLES_BY_TONGUE.get(
+            mother_tongue, _DEFAULT_STYLES_OTHER
+        )
+        style_preferences.german_colloquial = german_colloquial
+        style_preferences.english_colloquial = english_colloquial
+        logger.info("   ✅ %s defaults: %s", mother_tongue.capitalize(), description)
+    elif log_info:
+        style_counts = _count_selected_styles(style_preferences)
+        logger.info("🎯 User selected %s specific styles", style_counts['total'])
         if style_counts['german'] > 0:
-            logger.info(f"   🇩🇪 German: {style_counts['german']} styles")
+            logger.info("   🇩🇪 German: %s styles", style_counts['german'])
         if style_counts['english'] > 0:
-            logger.info(f"   🇺🇸 English: {style_counts['english']} styles")
+            logger.info("   🇺🇸 English: %s styles", style_counts['english'])
     
-    logger.info(f"🔍 DEFAULTS DEBUG: After processing:")
-    logger.info(f"   German native: {style_preferences.german_native}")
-    logger.info(f"   German formal: {style_preferences.german_formal}")
-    logger.info(f"   German colloquial: {style_preferences.german_colloquial}")
-    logger.info(f"   English native: {style_preferences.english_native}")
-    logger.info(f"   English formal: {style_preferences.english_formal}")
-    logger.info(f"   English colloquial: {style_preferences.english_colloquial}")
+    if log_info:
+        logger.info("🔍 DEFAULTS DEBUG: After processing:")
+        _log_style_flags(style_preferences)
     
     return style_preferences
 
-def _log_perfect_sync_setup(text: str, style_preferences: TranslationStylePreferences):
+def _log_perfect_sync_setup(text: str, style_preferences: TranslationStylePreferences, style_counts: Dict[str, int]):
     """Log the perfect sync translation setup with multi-style support"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     mother_tongue = style_preferences.mother_tongue or 'spanish'
-    style_counts = _count_selected_styles(style_preferences)
     
-    logger.info(f"\n" + "🎯" + "="*80)
-    logger.info(f"🎯 PERFECT UI-AUDIO SYNC MULTI-STYLE TRANSLATION SETUP")
-    logger.info(f"🎯" + "="*80)
-    logger.info(f"📝 Input Text: '{text}'")
-    logger.info(f"🌍 Mother Tongue: {mother_tongue.upper()}")
-    logger.info(f"📊 Total Styles Selected: {style_counts['total']}")
+    lines = [
+        "",
+        _BANNER,
+        "🎯 PERFECT UI-AUDIO SYNC MULTI-STYLE TRANSLATION SETUP",
+        _BANNER,
+        f"📝 Input Text: '{text}'",
+        f"🌍 Mother Tongue: {mother_tongue.upper()}",
+        f"📊 Total Styles Selected: {style_counts['total']}",
+    ]
     
     # Log expected behavior with perfect sync details
     expected_translations = []
@@ -251,54 +432,53 @@ def _log_perfect_sync_setup(text: str, style_preferences: TranslationStylePrefer
     
     # Log translation targets
     if automatic_translations:
-        logger.info(f"🔄 Automatic Translations: {', '.join(automatic_translations)}")
+        lines.append(f"🔄 Automatic Translations: {', '.join(automatic_translations)}")
     if expected_translations:
-        logger.info(f"🎯 User-Selected Translations: {', '.join(expected_translations)}")
+        lines.append(f"🎯 User-Selected Translations: {', '.join(expected_translations)}")
     
     # CRITICAL: Log perfect sync audio settings
-    logger.info(f"🎵 PERFECT SYNC Audio Settings:")
-    logger.info(f"   German word-by-word: {style_preferences.german_word_by_word}")
-    logger.info(f"   English word-by-word: {style_preferences.english_word_by_word}")
+    lines.append("🎵 PERFECT SYNC Audio Settings:")
+    lines.append(f"   German word-by-word: {style_preferences.german_word_by_word}")
+    lines.append(f"   English word-by-word: {style_preferences.english_word_by_word}")
     
     # Detailed style breakdown
-    logger.info(f"🇩🇪 German Styles Selected:")
-    logger.info(f"   🔍 RAW VALUES: native={style_preferences.german_native}, colloquial={style_preferences.german_colloquial}, informal={style_preferences.german_informal}, formal={style_preferences.german_formal}")
-    if style_preferences.german_native:
-        logger.info(f"   ✅ Native")
-    if style_preferences.german_colloquial:
-        logger.info(f"   ✅ Colloquial")
-    if style_preferences.german_informal:
-        logger.info(f"   ✅ Informal")
-    if style_preferences.german_formal:
-        logger.info(f"   ✅ Formal")
-    
-    logger.info(f"🇺🇸 English Styles Selected:")
-    logger.info(f"   🔍 RAW VALUES: native={style_preferences.english_native}, colloquial={style_preferences.english_colloquial}, informal={style_preferences.english_informal}, formal={style_preferences.english_formal}")
-    if style_preferences.english_native:
-        logger.info(f"   ✅ Native")
-    if style_preferences.english_colloquial:
-        logger.info(f"   ✅ Colloquial")
-    if style_preferences.english_informal:
-        logger.info(f"   ✅ Informal")
-    if style_preferences.english_formal:
-        logger.info(f"   ✅ Formal")
+    for flag, language in (("🇩🇪", "german"), ("🇺🇸", "english")):
+        native = getattr(style_preferences, f"{language}_native")
+        colloquial = getattr(style_preferences, f"{language}_colloquial")
+        informal = getattr(style_preferences, f"{language}_informal")
+        formal = getattr(style_preferences, f"{language}_formal")
+        lines.append(f"{flag} {language.capitalize()} Styles Selected:")
+        lines.append(
+            f"   🔍 RAW VALUES: native={native}, colloquial={colloquial}, "
+            f"informal={informal}, formal={formal}"
+        )
+        if native:
+            lines.append("   ✅ Native")
+        if colloquial:
+            lines.append("   ✅ Colloquial")
+        if informal:
+            lines.append("   ✅ Informal")
+        if formal:
+            lines.append("   ✅ Formal")
     
     # Audio format information
     if style_preferences.german_word_by_word or style_preferences.english_word_by_word:
-        logger.info(f"🎯 Multi-Style Audio Generation:")
-        logger.info(f"   • Each selected style will be spoken")
-        logger.info(f"   • Format: Full translation → Word-by-word breakdown")
-        logger.info(f"   • Word format: [target word] ([Spanish equivalent])")
-        logger.info(f"   • UI display will match audio EXACTLY")
+        lines.append("🎯 Multi-Style Audio Generation:")
+        lines.append("   • Each selected style will be spoken")
+        lines.append("   • Format: Full translation → Word-by-word breakdown")
+        lines.append("   • Word format: [target word] ([Spanish equivalent])")
+        lines.append("   • UI display will match audio EXACTLY")
     
-    logger.info(f"🎯" + "="*80)
+    lines.append(_BANNER)
+    # One record instead of ~30: a single pass through the handler chain
+    logger.info("\n".join(lines))
 
-def _validate_perfect_sync_response(translation: Translation, style_preferences: TranslationStylePreferences):
+def _validate_perfect_sync_response(translation: Translation, style_preferences: TranslationStylePreferences, style_counts: Dict[str, int]):
     """Validate perfect synchronization for multiple styles"""
-    logger.info("\n🔍 VALIDATING PERFECT MULTI-STYLE SYNCHRONIZATION")
-    logger.info("="*60)
-    
-    style_counts = _count_selected_styles(style_preferences)
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
+        logger.info("\n🔍 VALIDATING PERFECT MULTI-STYLE SYNCHRONIZATION")
+        logger.info(_SEP)
     
     validation_results = {
         'has_audio': translation.audio_path is not None,
@@ -311,10 +491,11 @@ def _validate_perfect_sync_response(translation: Translation, style_preferences:
         'errors': []
     }
     
-    logger.info(f"Audio generated: {validation_results['has_audio']}")
-    logger.info(f"Word-by-word data present: {validation_results['has_word_by_word']}")
-    logger.info(f"Word-by-word requested: {validation_results['word_by_word_requested']}")
-    logger.info(f"Styles requested: {validation_results['styles_requested']}")
+    if log_info:
+        logger.info("Audio generated: %s", validation_results['has_audio'])
+        logger.info("Word-by-word data present: %s", validation_results['has_word_by_word'])
+        logger.info("Word-by-word requested: %s", validation_results['word_by_word_requested'])
+        logger.info("Styles requested: %s", validation_results['styles_requested'])
     
     if validation_results['word_by_word_requested'] and validation_results['has_word_by_word']:
         logger.info("🎯 MULTI-STYLE PERFECT SYNC MODE ACTIVE - Validating...")
@@ -323,30 +504,40 @@ def _validate_perfect_sync_response(translation: Translation, style_preferences:
         word_by_word = translation.word_by_word
         total_pairs = len(word_by_word)
         
-        logger.info(f"📊 Total word pairs for UI display: {total_pairs}")
+        logger.info("📊 Total word pairs for UI display: %s", total_pairs)
         
-        # Group by style and validate
-        style_groups = {}
+        # Single pass: group by style, parse each order once and count phrasal verbs
+        style_groups = defaultdict(list)
+        order_errors = {}
+        phrasal_verb_count = 0
         for key, data in word_by_word.items():
             style_name = data.get('style', 'unknown')
-            language = data.get('language', 'unknown')
-            
-            if style_name not in style_groups:
-                style_groups[style_name] = []
-            style_groups[style_name].append((key, data))
+            try:
+                order = int(data.get('order', '0'))
+            except (TypeError, ValueError) as e:
+                order_errors.setdefault(style_name, e)
+                order = 0
+            style_groups[style_name].append((order, key, data))
+            if data.get('is_phrasal_verb') == 'true':
+                phrasal_verb_count += 1
         
         validation_results['styles_in_response'] = len(style_groups)
-        logger.info(f"📊 Styles in response: {validation_results['styles_in_response']}")
+        logger.info("📊 Styles in response: %s", validation_results['styles_in_response'])
+        
+        # Per-pair display logging is only worth building when DEBUG is on
+        log_pairs = logger.isEnabledFor(logging.DEBUG)
         
         # Validate each style's word-by-word data
         for style_name, pairs in style_groups.items():
             # Sort by order
             try:
-                pairs.sort(key=lambda x: int(x[1].get('order', '0')))
-                logger.info(f"✅ {style_name}: {len(pairs)} pairs in correct order")
+                if style_name in order_errors:
+                    raise order_errors[style_name]
+                pairs.sort(key=itemgetter(0))
+                logger.info("✅ %s: %s pairs in correct order", style_name, len(pairs))
                 
                 # Validate format for first few pairs
-                for i, (key, data) in enumerate(pairs[:3]):
+                for i, (_, key, data) in enumerate(islice(pairs, 3)):
                     source = data.get('source', '')
                     spanish = data.get('spanish', '')
                     display_format = data.get('display_format', '')
@@ -359,16 +550,15 @@ def _validate_perfect_sync_response(translation: Translation, style_preferences:
                             f"❌ {style_name}: Format mismatch - Expected: {expected_format}, Got: {display_format}"
                         )
                     
-                    if i < 3:
-                        logger.info(f"   {i+1}. {display_format} ✅")
+                    if log_pairs:
+                        logger.debug("   %s. %s ✅", i + 1, display_format)
                         
             except Exception as e:
                 validation_results['errors'].append(f"❌ {style_name}: Validation failed - {str(e)}")
         
         # Check for phrasal/separable verbs
-        phrasal_verbs = [data for data in word_by_word.values() if data.get('is_phrasal_verb') == 'true']
-        if phrasal_verbs:
-            logger.info(f"🔗 Found {len(phrasal_verbs)} phrasal/separable verbs across all styles")
+        if phrasal_verb_count:
+            logger.info("🔗 Found %s phrasal/separable verbs across all styles", phrasal_verb_count)
     
     elif validation_results['word_by_word_requested'] and not validation_results['has_word_by_word']:
         validation_results['warnings'].append("⚠️ Word-by-word requested but no data generated")
@@ -376,104 +566,208 @@ def _validate_perfect_sync_response(translation: Translation, style_preferences:
     
     # Final validation summary
     if validation_results['errors']:
-        logger.error(f"❌ MULTI-STYLE SYNC VALIDATION FAILED: {len(validation_results['errors'])} errors")
+        logger.error("❌ MULTI-STYLE SYNC VALIDATION FAILED: %s errors", len(validation_results['errors']))
         for error in validation_results['errors']:
-            logger.error(f"   {error}")
+            logger.error("   %s", error)
     elif validation_results['word_by_word_requested']:
         logger.info("✅ PERFECT MULTI-STYLE UI-AUDIO SYNCHRONIZATION VALIDATED")
-        logger.info(f"🎯 {validation_results['styles_in_response']} styles with perfect sync")
+        logger.info("🎯 %s styles with perfect sync", validation_results['styles_in_response'])
     else:
         logger.info("ℹ️ Simple translation mode - no perfect sync validation needed")
     
-    logger.info("="*60)
+    logger.info(_SEP)
     return validation_results
 
-# Health check endpoint with perfect sync info
-@app.get("/health")
-async def health_check():
-    """Health check with perfect UI-Audio synchronization and multi-style status"""
-    # Create audio directory
-    audio_dir = "/tmp/tts_audio" if os.name != "nt" else os.path.join(os.environ.get("TEMP", ""), "tts_audio")
+def _log_word_by_word_debug_info(translation: Translation, styles_in_response: int):
+    """Log a summary of the word-by-word data the UI will render"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    logger.info("\n📱 MULTI-STYLE WORD-BY-WORD UI VISUALIZATION DEBUG:")
+    logger.info(_SEP)
+    if translation.word_by_word:
+        logger.info("   📝 Word-by-word data available for UI")
+        logger.info("   📊 Total UI elements: %s", len(translation.word_by_word))
+        logger.info("   🎯 Styles covered: %s", styles_in_response)
+        
+        # Log a sample of UI data structure
+        for data in islice(translation.word_by_word.values(), 5):
+            logger.info("   📱 %s: %s", data.get('style', 'unknown'), data.get('display_format', 'N/A'))
+    else:
+        logger.info("   📝 No word-by-word data available for UI")
+    
+    logger.info(_SEP)
+
+_UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+def _safe_unlink(path: str):
+    """Remove a file, ignoring it if it is already gone"""
     try:
-        os.makedirs(audio_dir, exist_ok=True)
-        if os.name != "nt":
-            os.chmod(audio_dir, 0o755)
-    except Exception as e:
-        logger.warning(f"Could not create audio directory: {str(e)}")
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+_cleanup_tasks: set = set()  # strong references so pending cleanups are not garbage collected
+
+def _log_cleanup_result(task: asyncio.Task):
+    """Drop the finished cleanup task and log it if the unlink failed"""
+    _cleanup_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Temp file cleanup failed: {task.exception()}")
+
+def _schedule_temp_cleanup(path: str):
+    """Delete a temp file in a worker thread without holding up the response"""
+    task = asyncio.create_task(asyncio.to_thread(_safe_unlink, path))
+    _cleanup_tasks.add(task)
+    task.add_done_callback(_log_cleanup_result)
 
+# Upload MIME type -> temp file extension
+_MIME_MAP = {
+    "audio/wav": ".wav",
+    "audio/aac": ".aac",
+    "audio/mpeg": ".mp3",
+    "audio/ogg": ".ogg"
+}
+_ALLOWED_EXT = frozenset(_MIME_MAP.values())
+
+# Uploads (and the .wav the speech service converts them to, written alongside) go to
+# the default temp dir. UPLOAD_TMP_DIR opts into another location such as a tmpfs
+# subdirectory; container /dev/shm is small, so a full one falls back to the default.
+_UPLOAD_TMP_DIR = os.environ.get("UPLOAD_TMP_DIR") or None
+
+def _write_upload(src, suffix: str, tmp_dir: Optional[str]) -> str:
+    """Copy an upload's spooled file into a new temp file in tmp_dir and return its path"""
+    fd, tmp_path = tempfile.mkstemp(suffix=suffix, dir=tmp_dir)
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            shutil.copyfileobj(src, out, _UPLOAD_CHUNK_SIZE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return tmp_path
+
+def _copy_upload_to_temp(src, suffix: str) -> str:
+    """Copy an upload into UPLOAD_TMP_DIR if configured, else (or if that fails) the default temp dir"""
+    if _UPLOAD_TMP_DIR:
+        try:
+            os.makedirs(_UPLOAD_TMP_DIR, exist_ok=True)
+            return _write_upload(src, suffix, _UPLOAD_TMP_DIR)
+        except OSError as e:
+            logger.warning(f"Upload temp dir {_UPLOAD_TMP_DIR} unusable ({e}), using default temp dir")
+            src.seek(0)
+    return _write_upload(src, suffix, None)
+
+async def _save_upload_to_temp(file: UploadFile, suffix: str) -> str:
+    """Write an uploaded file to a new temp file in a single worker-thread hop"""
+    await file.seek(0)
+    return await asyncio.to_thread(_copy_upload_to_temp, file.file, suffix)
+
+async def _process_upload(file: UploadFile, suffix: str, process, mother_tongue: str):
+    """Save an upload to a temp file, run process(path, mother_tongue) on it, then clean up"""
+    tmp_path = await _save_upload_to_temp(file, suffix)
+    logger.debug(f"Created temp file: {tmp_path}")
+    try:
+        return await process(tmp_path, mother_tongue)
+    finally:
+        _schedule_temp_cleanup(tmp_path)
+
+# Health check endpoint with perfect sync info
+# Everything except the timestamp is fixed for the life of the process, so the
+# body is serialized once and only the timestamp placeholder is patched per probe.
+_HEALTH_TIMESTAMP_PLACEHOLDER = b"{TS}"
+_HEALTH_TEMPLATE = orjson.dumps({
+    "status": "healthy",
+    "service": "Perfect UI-Audio Sync Translation API with Multi-Style",
+    "version": "4.0-MULTI-STYLE",
+    "timestamp": _HEALTH_TIMESTAMP_PLACEHOLDER.decode(),
+    "perfect_sync_features": {
+        "ui_audio_synchronization": "GUARANTEED perfect match",
+        "format_consistency": "UI display format = Audio speech format",
+        "order_consistency": "UI display order = Audio speaking order",
+        "phrasal_verb_handling": "Single units in both UI and audio",
+        "contextual_accuracy": "AI provides context-aware translations",
+        "validation_system": "Zero discrepancies allowed",
+        "multi_style_support": "Multiple simultaneous translation styles"
+    },
+    "multi_style_features": {
+        "simultaneous_styles": "Select multiple styles at once",
+        "per_style_audio": "Each style gets its own audio segment",
+        "word_by_word_all_styles": "Word-by-word for all selected styles",
+        "perfect_sync_all_styles": "UI-Audio sync maintained for each style"
+    },
+    "sync_guarantee": {
+        "what_you_see": "EXACTLY what you hear",
+        "format": "[target word/phrase] ([Spanish equivalent])",
+        "order": "Sequential, perfectly synchronized",
+        "validation": "Automatic validation with error reporting"
+    },
+    "temp_dir": tempfile.gettempdir(),
+    "audio_dir": AUDIO_DIR,
     # Check environment variables
-    env_vars = {
+    "environment_vars": {
         "AZURE_SPEECH_KEY": bool(os.environ.get("AZURE_SPEECH_KEY")),
         "AZURE_SPEECH_REGION": bool(os.environ.get("AZURE_SPEECH_REGION")),
         "GEMINI_API_KEY": bool(os.environ.get("GEMINI_API_KEY")),
         "PORT": os.environ.get("PORT", "8000"),
-    }
+    },
+    "supported_languages": speech_service.get_supported_languages()
+})
 
-    return {
-        "status": "healthy",
-        "service": "Perfect UI-Audio Sync Translation API with Multi-Style",
-        "version": "4.0-MULTI-STYLE",
-        "timestamp": datetime.utcnow().isoformat(),
-        "perfect_sync_features": {
-            "ui_audio_synchronization": "GUARANTEED perfect match",
-            "format_consistency": "UI display format = Audio speech format",
-            "order_consistency": "UI display order = Audio speaking order",
-            "phrasal_verb_handling": "Single units in both UI and audio",
-            "contextual_accuracy": "AI provides context-aware translations",
-            "validation_system": "Zero discrepancies allowed",
-            "multi_style_support": "Multiple simultaneous translation styles"
-        },
-        "multi_style_features": {
-            "simultaneous_styles": "Select multiple styles at once",
-            "per_style_audio": "Each style gets its own audio segment",
-            "word_by_word_all_styles": "Word-by-word for all selected styles",
-            "perfect_sync_all_styles": "UI-Audio sync maintained for each style"
-        },
-        "sync_guarantee": {
-            "what_you_see": "EXACTLY what you hear",
-            "format": "[target word/phrase] ([Spanish equivalent])",
-            "order": "Sequential, perfectly synchronized",
-            "validation": "Automatic validation with error reporting"
-        },
-        "temp_dir": tempfile.gettempdir(),
-        "audio_dir": audio_dir,
-        "environment_vars": env_vars,
-        "supported_languages": speech_service.get_supported_languages()
+# Probes arrive far more often than once a second, so the body is re-rendered
+# at most once per wall-clock second
+_health_body_second = -1
+_health_body = b""
+
+@app.get("/health")
+async def health_check():
+    """Health check with perfect UI-Audio synchronization and multi-style status"""
+    global _health_body_second, _health_body
+    now = int(time.time())
+    if now != _health_body_second:
+        timestamp = datetime.utcfromtimestamp(now).isoformat().encode()
+        _health_body = _HEALTH_TEMPLATE.replace(_HEALTH_TIMESTAMP_PLACEHOLDER, timestamp, 1)
+        _health_body_second = now
+    return Response(content=_health_body, media_type="application/json")
+
+# The root and supported-languages documents only change on deploy
+_STATIC_JSON_HEADERS = {"Cache-Control": "public, max-age=60"}
+
+_ROOT_JSON = orjson.dumps({
+    "status": "ok 100 claude code", 
+    "service": "Perfect UI-Audio Sync Translation API with Multi-Style Support",
+    "description": "GUARANTEED perfect synchronization with multiple simultaneous translation styles",
+    "version": "4.0-MULTI-STYLE",
+    "perfect_sync_guarantee": {
+        "visual_audio_match": "What you see is exactly what you hear",
+        "format_consistency": "UI format = Audio format (identical)",
+        "order_consistency": "UI order = Audio order (identical)",
+        "phrasal_verb_unity": "Phrasal/separable verbs as single units",
+        "zero_discrepancies": "Perfect synchronization guaranteed",
+        "multi_style_support": "All selected styles perfectly synchronized"
+    },
+    "requirements_compliance": {
+        "multi_style_solution": "Handle multiple simultaneous translation styles",
+        "spanish_mother_tongue": "German and/or English based on selections",
+        "english_mother_tongue": "Spanish (automatic) + German if selected", 
+        "german_mother_tongue": "Spanish (automatic) + English if selected",
+        "word_by_word_audio": "Available for ALL selected styles",
+        "audio_format": "[target word] ([Spanish equivalent])",
+        "ai_powered": "Contextually accurate translations for each style",
+        "dynamic_behavior": "Based on user preferences"
+    },
+    "endpoints": {
+        "/api/conversation": "Main perfect sync multi-style translation endpoint",
+        "/api/conversation/batch": "Translate up to 32 prompts in one request",
+        "/api/speech-to-text": "Speech recognition with mother tongue detection",
+        "/api/voice-command": "Voice command processing",
+        "/api/audio/{filename}": "Audio file serving",
+        "/health": "Health check with perfect sync and multi-style status"
     }
+})
 
 @app.get("/")
 async def root():
-    return {
-        "status": "ok 100 claude code", 
-        "service": "Perfect UI-Audio Sync Translation API with Multi-Style Support",
-        "description": "GUARANTEED perfect synchronization with multiple simultaneous translation styles",
-        "version": "4.0-MULTI-STYLE",
-        "perfect_sync_guarantee": {
-            "visual_audio_match": "What you see is exactly what you hear",
-            "format_consistency": "UI format = Audio format (identical)",
-            "order_consistency": "UI order = Audio order (identical)",
-            "phrasal_verb_unity": "Phrasal/separable verbs as single units",
-            "zero_discrepancies": "Perfect synchronization guaranteed",
-            "multi_style_support": "All selected styles perfectly synchronized"
-        },
-        "requirements_compliance": {
-            "multi_style_solution": "Handle multiple simultaneous translation styles",
-            "spanish_mother_tongue": "German and/or English based on selections",
-            "english_mother_tongue": "Spanish (automatic) + German if selected", 
-            "german_mother_tongue": "Spanish (automatic) + English if selected",
-            "word_by_word_audio": "Available for ALL selected styles",
-            "audio_format": "[target word] ([Spanish equivalent])",
-            "ai_powered": "Contextually accurate translations for each style",
-            "dynamic_behavior": "Based on user preferences"
-        },
-        "endpoints": {
-            "/api/conversation": "Main perfect sync multi-style translation endpoint",
-            "/api/speech-to-text": "Speech recognition with mother tongue detection",
-            "/api/voice-command": "Voice command processing",
-            "/api/audio/{filename}": "Audio file serving",
-            "/health": "Health check with perfect sync and multi-style status"
-        }
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json", headers=_STATIC_JSON_HEADERS)
 
 @app.post("/api/conversation", response_model=Translation)
 async def start_conversation(prompt: PromptRequest):
@@ -482,15 +776,11 @@ async def start_conversation(prompt: PromptRequest):
     """
     try:
         # DEBUG: Log exactly what we received
-        logger.info("🔍 RAW REQUEST DEBUG:")
-        logger.info(f"   style_preferences is None: {prompt.style_preferences is None}")
-        if prompt.style_preferences is not None:
-            logger.info(f"   RAW german_native: {prompt.style_preferences.german_native}")
-            logger.info(f"   RAW german_formal: {prompt.style_preferences.german_formal}")
-            logger.info(f"   RAW german_colloquial: {prompt.style_preferences.german_colloquial}")
-            logger.info(f"   RAW english_native: {prompt.style_preferences.english_native}")
-            logger.info(f"   RAW english_formal: {prompt.style_preferences.english_formal}")
-            logger.info(f"   RAW english_colloquial: {prompt.style_preferences.english_colloquial}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🔍 RAW REQUEST DEBUG:")
+            logger.info("   style_preferences is None: %s", prompt.style_preferences is None)
+            if prompt.style_preferences is not None:
+                _log_style_flags(prompt.style_preferences, prefix="RAW ")
         
         # Set up default style preferences if none provided
         if prompt.style_preferences is None:
@@ -500,30 +790,39 @@ async def start_conversation(prompt: PromptRequest):
                 mother_tongue="spanish"
             )
         
-        # Validate and normalize mother tongue
-        mother_tongue = _validate_mother_tongue(prompt.style_preferences.mother_tongue or 'spanish')
-        prompt.style_preferences.mother_tongue = mother_tongue
+        # Mother tongue was normalized (and defaulted) when the request was parsed
+        mother_tongue = prompt.style_preferences.mother_tongue
         
         # Apply intelligent defaults if no styles selected
         logger.info("🔍 ABOUT TO CALL _apply_intelligent_defaults")
-        prompt.style_preferences = _apply_intelligent_defaults(prompt.style_preferences)
+        prompt.style_preferences = _apply_intelligent_defaults(prompt.style_preferences, mother_tongue)
         logger.info("🔍 FINISHED CALLING _apply_intelligent_defaults")
         
+        # Styles are final from here on, so count them once for logging and validation
+        style_counts = _count_selected_styles(prompt.style_preferences)
+        
         # Log the perfect sync translation setup
-        _log_perfect_sync_setup(prompt.text, prompt.style_preferences)
+        _log_perfect_sync_setup(prompt.text, prompt.style_preferences, style_counts)
         
         # Process the translation with perfect sync and multi-style support
-        logger.info(f"🚀 Starting PERFECT SYNC MULTI-STYLE translation with mother tongue: {mother_tongue}")
+        logger.info("🚀 Starting PERFECT SYNC MULTI-STYLE translation with mother tongue: %s", mother_tongue)
         
         try:
-            # Use high-speed optimized translation for blazing fast responses
-            response = await optimized_translation_process(
-                text=prompt.text, 
-                source_lang=prompt.source_lang or "auto", 
-                target_lang=prompt.target_lang or "multi",
-                style_preferences=prompt.style_preferences,
-                mother_tongue=mother_tongue
-            )
+            cache_key = _translation_cache_key(prompt, mother_tongue)
+            response = _get_cached_translation(cache_key)
+            if response is not None:
+                logger.info("⚡ Serving repeated request from translation cache")
+            else:
+                # Identical concurrent requests share a single translation
+                response = await shared_translation_process(
+                    cache_key,
+                    text=prompt.text, 
+                    source_lang=prompt.source_lang or "auto", 
+                    target_lang=prompt.target_lang or "multi",
+                    style_preferences=prompt.style_preferences,
+                    mother_tongue=mother_tongue
+                )
+                _cache_translation(cache_key, response)
         except Exception as translation_error:
             logger.error(f"❌ Translation service error: {str(translation_error)}")
             
@@ -544,14 +843,12 @@ async def start_conversation(prompt: PromptRequest):
         
         # CRITICAL: Validate perfect synchronization for multiple styles
         try:
-            sync_validation = _validate_perfect_sync_response(response, prompt.style_preferences)
+            sync_validation = _validate_perfect_sync_response(response, prompt.style_preferences, style_counts)
         except Exception as validation_error:
             logger.warning(f"⚠️ Sync validation error: {str(validation_error)}")
             sync_validation = {'errors': [], 'warnings': ['Validation skipped due to error']}
         
         # Log the successful completion with sync details and CONFIDENCE RATINGS
-        style_counts = _count_selected_styles(prompt.style_preferences)
-        
         try:
             completion_info = f"[SUCCESS] PERFECT SYNC MULTI-STYLE translation completed successfully"
             print(completion_info)  # Console output
@@ -592,45 +889,34 @@ async def start_conversation(prompt: PromptRequest):
             # Fallback for Windows console
             logger.info("[SUCCESS] Translation completed with confidence monitoring")
         
-        logger.info(f"   Input ('{response.source_language}'): {response.original_text}")
-        logger.info(f"   Output length: {len(response.translated_text)} characters")
-        logger.info(f"   Styles processed: {style_counts['total']}")
-        logger.info(f"   Audio generated: {'Yes' if response.audio_path else 'No'}")
-        logger.info(f"   Word-by-word data: {'Yes' if response.word_by_word else 'No'}")
-        
-        if response.audio_path:
-            # Check if word-by-word was requested
-            word_by_word_requested = (
-                prompt.style_preferences.german_word_by_word or 
-                prompt.style_preferences.english_word_by_word
-            )
-            logger.info(f"   Audio type: {'Multi-style word-by-word breakdown' if word_by_word_requested else 'Multi-style translation reading'}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("   Input ('%s'): %s", response.source_language, response.original_text)
+            logger.info("   Output length: %s characters", len(response.translated_text))
+            logger.info("   Styles processed: %s", style_counts['total'])
+            logger.info("   Audio generated: %s", 'Yes' if response.audio_path else 'No')
+            logger.info("   Word-by-word data: %s", 'Yes' if response.word_by_word else 'No')
             
-            if word_by_word_requested and response.word_by_word:
-                total_pairs = len(response.word_by_word)
-                logger.info(f"   Perfect sync pairs: {total_pairs}")
-                logger.info(f"   Styles in sync: {sync_validation.get('styles_in_response', 0)}")
-                logger.info(f"   Synchronization status: {'✅ PERFECT' if not sync_validation['errors'] else '❌ ISSUES DETECTED'}")
+            if response.audio_path:
+                # Check if word-by-word was requested
+                word_by_word_requested = (
+                    prompt.style_preferences.german_word_by_word or 
+                    prompt.style_preferences.english_word_by_word
+                )
+                logger.info(
+                    "   Audio type: %s",
+                    'Multi-style word-by-word breakdown' if word_by_word_requested else 'Multi-style translation reading'
+                )
+                
+                if word_by_word_requested and response.word_by_word:
+                    logger.info("   Perfect sync pairs: %s", len(response.word_by_word))
+                    logger.info("   Styles in sync: %s", sync_validation.get('styles_in_response', 0))
+                    logger.info(
+                        "   Synchronization status: %s",
+                        '✅ PERFECT' if not sync_validation['errors'] else '❌ ISSUES DETECTED'
+                    )
         
         # Add perfect sync validation info to response (for debugging)
-        logger.info("\n📱 MULTI-STYLE WORD-BY-WORD UI VISUALIZATION DEBUG:")
-        logger.info("="*60)
-        if response.word_by_word:
-            logger.info(f"   📝 Word-by-word data available for UI")
-            logger.info(f"   📊 Total UI elements: {len(response.word_by_word)}")
-            logger.info(f"   🎯 Styles covered: {sync_validation.get('styles_in_response', 0)}")
-            
-            # Log a sample of UI data structure
-            sample_keys = list(response.word_by_word.keys())[:5]
-            for key in sample_keys:
-                data = response.word_by_word[key]
-                style = data.get('style', 'unknown')
-                format_str = data.get('display_format', 'N/A')
-                logger.info(f"   📱 {style}: {format_str}")
-        else:
-            logger.info(f"   📝 No word-by-word data available for UI")
-        
-        logger.info("="*60)
+        _log_word_by_word_debug_info(response, sync_validation.get('styles_in_response', 0))
         
         return response
         
@@ -664,10 +950,19 @@ async def start_conversation(prompt: PromptRequest):
                 detail="Translation service is temporarily unavailable. Please try again later."
             )
 
+@app.post("/api/conversation/batch", response_model=List[Translation])
+async def start_conversation_batch(request: BatchPromptRequest):
+    """
+    Translate several prompts in one round trip. Each prompt goes through the same
+    pipeline as /api/conversation, so cache hits are served directly and identical
+    prompts share one translation.
+    """
+    logger.info(f"📦 Batch conversation request with {len(request.prompts)} prompts")
+    return await asyncio.gather(*(start_conversation(prompt) for prompt in request.prompts))
+
 @app.post("/api/speech-to-text")
 async def speech_to_text(file: UploadFile = File(...), mother_tongue: Optional[str] = "auto"):
     """Speech-to-text with dynamic mother tongue detection and support."""
-    tmp_path = None
     try:
         # Validate mother tongue if provided
         if mother_tongue and mother_tongue != "auto":
@@ -677,30 +972,17 @@ async def speech_to_text(file: UploadFile = File(...), mother_tongue: Optional[s
         
         # MIME type handling
         content_type = file.content_type or "audio/wav"
-        ext = ".wav"
-        mime_map = {
-            "audio/wav": ".wav",
-            "audio/aac": ".aac",
-            "audio/mpeg": ".mp3",
-            "audio/ogg": ".ogg"
-        }
-        
-        if content_type in mime_map:
-            ext = mime_map[content_type]
-        else:
+        ext = _MIME_MAP.get(content_type)
+        if ext is None:
             filename_ext = os.path.splitext(file.filename or "")[1].lower()
-            ext = filename_ext if filename_ext in [".wav", ".aac", ".mp3", ".ogg"] else ".wav"
+            ext = filename_ext if filename_ext in _ALLOWED_EXT else ".wav"
 
-        # Create temp file
-        with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-            logger.debug(f"Created temp file: {tmp_path}")
-
-        # Process audio with mother tongue support
+        # Process audio with mother tongue support; the temp copy is only made once a
+        # speech slot is free, so queued uploads don't pile up on the temp filesystem
         logger.info(f"🎤 Processing speech-to-text with mother tongue: {mother_tongue}")
-        recognized_text = await speech_service.process_audio(tmp_path, mother_tongue)
+        recognized_text = await _run_limited(
+            _speech_semaphore, _process_upload, file, ext, speech_service.process_audio, mother_tongue
+        )
         
         return {
             "text": recognized_text,
@@ -716,19 +998,12 @@ async def speech_to_text(file: UploadFile = File(...), mother_tongue: Optional[s
             status_code=500,
             detail="Audio processing failed. Please check audio format and try again."
         )
-    finally:
-        # Cleanup temp file
-        if tmp_path and os.path.exists(tmp_path):
-            try:
-                os.unlink(tmp_path)
-                logger.debug(f"Cleaned up temp file: {tmp_path}")
-            except Exception as e:
-                logger.error(f"Final cleanup failed: {str(e)}")
+
+_WAKE_WORDS = {lang: tuple(config['wake_words']) for lang, config in speech_service.language_configs.items()}
 
 @app.post("/api/voice-command")
 async def process_voice_command(file: UploadFile = File(...), mother_tongue: Optional[str] = "auto"):
     """Voice command processing with dynamic mother tongue support."""
-    tmp_path = None
     try:
         # Validate mother tongue
         if mother_tongue and mother_tongue != "auto":
@@ -736,18 +1011,15 @@ async def process_voice_command(file: UploadFile = File(...), mother_tongue: Opt
         else:
             mother_tongue = "spanish"  # Default
             
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-            
         logger.info(f"🎙️ Processing voice command with mother tongue: {mother_tongue}")
-        command_text = await speech_service.process_command(tmp_path, mother_tongue)
+        command_text = await _run_limited(
+            _speech_semaphore, _process_upload, file, '.wav', speech_service.process_command, mother_tongue
+        )
         
         return {
             "command": command_text,
             "language": mother_tongue,
-            "supported_commands": speech_service.language_configs[mother_tongue]['wake_words']
+            "supported_commands": _WAKE_WORDS[mother_tongue]
         }
         
     except Exception as e:
@@ -756,74 +1028,87 @@ async def process_voice_command(file: UploadFile = File(...), mother_tongue: Opt
             status_code=500,
             detail="Voice command processing failed"
         )
-    finally:
-        if tmp_path and os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+
+class _AudioFileResponse(FileResponse):
+    """FileResponse that streams in 1 MiB reads instead of Starlette's default 64 KiB"""
+    chunk_size = 1 << 20
+
+# Generated names are like speech_<timestamp>_<hex>.mp3: allow only that alphabet, never '..'
+_AUDIO_FILENAME = re.compile(r'(?!.*\.\.)[A-Za-z0-9._-]+')
+
+# Generated audio names carry a random suffix and are never rewritten, so clients
+# and CDNs may keep them; the ETag still answers revalidations with a 304.
+_AUDIO_HEADERS = {
+    "Cache-Control": "public, max-age=31536000, immutable",
+    "Access-Control-Allow-Origin": "*"
+}
 
 @app.get("/api/audio/{filename}")
-async def get_audio(filename: str):
+async def get_audio(filename: str, request: Request):
     """Serve generated audio files"""
     try:
-        if ".." in filename or "/" in filename:
+        if not _AUDIO_FILENAME.fullmatch(filename):
             raise HTTPException(status_code=400, detail="Invalid filename")
 
-        audio_dir = os.path.join(
-            os.environ.get("TEMP", ""), 
-            "tts_audio"
-        ) if os.name == "nt" else "/tmp/tts_audio"
-
-        file_path = os.path.join(audio_dir, filename)
+        file_path = os.path.join(AUDIO_DIR, filename)
         
-        if not os.path.exists(file_path):
+        # One stat answers both "does it exist" and the FileResponse metadata
+        try:
+            stat_result = await aiofiles.os.stat(file_path)
+        except FileNotFoundError:
             logger.warning(f"Audio file not found: {file_path}")
             raise HTTPException(status_code=404, detail="Audio file not found")
 
-        return FileResponse(
+        etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        headers = {**_AUDIO_HEADERS, "ETag": etag}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
+        return _AudioFileResponse(
             path=file_path,
             media_type="audio/mp3",
             filename=filename,
-            headers={
-                "Cache-Control": "no-cache",
-                "Access-Control-Allow-Origin": "*"
-            }
+            stat_result=stat_result,
+            headers=headers
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Audio delivery error: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+# The language list and feature descriptions are static, so the payload is
+# serialized once at import, the same way as the root document.
+_SUPPORTED_LANGUAGES_JSON = orjson.dumps({
+    "supported_languages": speech_service.get_supported_languages(),
+    "default": "spanish",
+    "behavior": {
+        "spanish": "Translates to German and/or English based on user selections",
+        "english": "Translates to Spanish (automatic) + German if selected",
+        "german": "Translates to Spanish (automatic) + English if selected",
+        "others": "Translate to German and/or English based on user selections"
+    },
+    "multi_style_features": {
+        "simultaneous_styles": "Select multiple styles at once (e.g., Native + Colloquial + Formal)",
+        "per_style_translation": "Each style gets its own contextually appropriate translation",
+        "all_styles_audio": "Audio includes all selected styles sequentially",
+        "word_by_word_all_styles": "Word-by-word breakdown for each selected style"
+    },
+    "perfect_sync_features": {
+        "word_by_word_audio": "Generated for ALL selected styles when enabled",
+        "audio_format": "[target word] ([Spanish equivalent])",
+        "ui_format": "EXACTLY the same as audio format",
+        "synchronization": "Perfect - UI order = Audio order for all styles",
+        "phrasal_verbs": "Treated as single units in both UI and audio",
+        "validation": "Automatic validation ensures zero discrepancies"
+    },
+    "description": "Perfect UI-Audio synchronization with multi-style support - What you see is exactly what you hear for ALL selected styles"
+})
+
 @app.get("/api/supported-languages")
 async def get_supported_languages():
     """Get list of supported mother tongue languages with perfect sync and multi-style info"""
-    try:
-        languages = speech_service.get_supported_languages()
-        return {
-            "supported_languages": languages,
-            "default": "spanish",
-            "behavior": {
-                "spanish": "Translates to German and/or English based on user selections",
-                "english": "Translates to Spanish (automatic) + German if selected",
-                "german": "Translates to Spanish (automatic) + English if selected",
-                "others": "Translate to German and/or English based on user selections"
-            },
-            "multi_style_features": {
-                "simultaneous_styles": "Select multiple styles at once (e.g., Native + Colloquial + Formal)",
-                "per_style_translation": "Each style gets its own contextually appropriate translation",
-                "all_styles_audio": "Audio includes all selected styles sequentially",
-                "word_by_word_all_styles": "Word-by-word breakdown for each selected style"
-            },
-            "perfect_sync_features": {
-                "word_by_word_audio": "Generated for ALL selected styles when enabled",
-                "audio_format": "[target word] ([Spanish equivalent])",
-                "ui_format": "EXACTLY the same as audio format",
-                "synchronization": "Perfect - UI order = Audio order for all styles",
-                "phrasal_verbs": "Treated as single units in both UI and audio",
-                "validation": "Automatic validation ensures zero discrepancies"
-            },
-            "description": "Perfect UI-Audio synchronization with multi-style support - What you see is exactly what you hear for ALL selected styles"
-        }
-    except Exception as e:
-        logger.error(f"Error fetching supported languages: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to fetch supported languages")
+    return Response(content=_SUPPORTED_LANGUAGES_JSON, media_type="application/json", headers=_STATIC_JSON_HEADERS)
 
 @app.get("/api/style-combinations")
 async def get_style_combinations():
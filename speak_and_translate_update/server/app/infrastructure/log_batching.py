@@ -0,0 +1,74 @@
+# log_batching.py - Batched log file writes for the QueueListener threads
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that leaves flushing to its listener instead of flushing every record"""
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that flushes its handlers once the queue goes idle.
+
+    While records keep arriving they accumulate in the handlers' stream buffers;
+    as soon as no record shows up for flush_interval seconds everything written
+    so far is flushed in one go.
+    """
+
+    def __init__(self, log_queue, *handlers, respect_handler_level=False, flush_interval=0.01):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+        self._unflushed = False
+
+    def dequeue(self, block):
+        if self._unflushed:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+                self._unflushed = False
+        record = self.queue.get(block)
+        self._unflushed = True
+        return record
+
+
+def configure_logging(*handlers):
+    """
+    Route all logging through a queue served by a BatchingQueueListener.
+
+    The root logger only gets a QueueHandler, so logging calls just enqueue;
+    the given handlers run on the listener thread. The listener is stopped
+    and its handlers closed at interpreter exit.
+    """
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(
+        level=logging.DEBUG,
+        handlers=[queue_handler],
+        force=True  # Override any existing log configurations
+    )
+    listener = BatchingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    def stop():
+        """Drain queued records and flush the handlers on exit"""
+        listener.stop()
+        for handler in handlers:
+            handler.close()
+
+    atexit.register(stop)
+    return listener
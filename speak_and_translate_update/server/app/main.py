@@ -1,6 +1,6 @@
 # server/app/main.py
 import uvicorn
-from app.infrastructure.api.routes import app
+from app.infrastructure.log_batching import BufferedFileHandler, configure_logging
 import os
 import logging
 from datetime import datetime
@@ -33,17 +33,24 @@ class UTF8StreamHandler(logging.StreamHandler):
         except Exception:
             self.handleError(record)
 
-# Configure logging first to capture all events
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        UTF8StreamHandler(),  # Use our custom UTF-8 handler
-        logging.FileHandler("api.log", encoding='utf-8')  # Ensure file handler uses UTF-8
-    ],
-    force=True  # Override any existing log configurations
+# Configure logging first to capture all events, before routes is imported so it
+# finds the root logger configured and skips its own setup. uvicorn's worker
+# processes re-import this module as __mp_main__, so they get the same pipeline.
+# Records are only enqueued on the calling thread; the console and file handlers
+# run on a QueueListener thread, and api.log is flushed once the queue goes idle.
+_log_formatter = logging.Formatter(
+    fmt='%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
 )
+_console_handler = UTF8StreamHandler()  # Use our custom UTF-8 handler
+_console_handler.setFormatter(_log_formatter)
+_file_handler = BufferedFileHandler("api.log", encoding='utf-8', delay=True)  # Ensure file handler uses UTF-8
+_file_handler.setFormatter(_log_formatter)
+
+configure_logging(_console_handler, _file_handler)
+
+from app.infrastructure.api.routes import app  # imported only once logging is configured
+
 logger = logging.getLogger(__name__)
 
 # Alternative: Define emoji-free messages for Windows compatibility
@@ -59,7 +66,8 @@ if __name__ == "__main__":
                                 "[INIT] Initializing SpeakAndTranslate Azure Server"))
     logger.debug(f"Python version: {os.sys.version}")
     logger.debug(f"Current working directory: {os.getcwd()}")
-    logger.debug(f"Environment variables: {dict(os.environ)}")
+    # Names only: values include the Azure and Gemini keys
+    logger.debug("Environment variable names: %s", sorted(os.environ))
 
     # Create audio directory with proper permissions
     audio_dir = "/tmp/tts_audio" if os.name != "nt" else os.path.join(
@@ -118,11 +126,22 @@ if __name__ == "__main__":
                                      f"[WARN] High-speed optimizer initialization failed: {e}"))
         logger.info("Continuing with standard translation service...")
 
+    # Worker count follows the usual WEB_CONCURRENCY convention; multiple workers
+    # require uvicorn to import the app itself, so pass it as an import string
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    logger.info(f"Workers: {workers}")
+
     # Start the server with detailed UVicorn configuration
+    # uvloop/httptools come from uvicorn[standard]; "auto" falls back to
+    # asyncio/h11 where they are unavailable (e.g. uvloop on Windows)
     uvicorn.run(
-        app,
+        "app.infrastructure.api.routes:app" if workers > 1 else app,
         host=host,
         port=port,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        lifespan="on",  # a lifespan startup error aborts instead of being skipped
         proxy_headers=True,
         forwarded_allow_ips="*",
         log_config=None,  # Use our already configured logging
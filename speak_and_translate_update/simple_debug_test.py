@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 import requests
-import json
+import orjson
+from itertools import islice
 
-def simple_debug():
+_SESSION = requests.Session()
+
+def simple_debug(session=None):
+    session = session or _SESSION
     url = "http://localhost:8000/api/conversation"
     
     # Test: Word-by-word audio DISABLED
@@ -21,13 +25,18 @@ def simple_debug():
     
     print("TESTING: Word-by-word audio DISABLED for both languages")
     print("Request payload:")
-    print(json.dumps(payload, indent=2))
+    print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
     
     try:
-        response = requests.post(url, json=payload, timeout=60)
+        response = session.post(
+            url,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=60,
+        )
         response.raise_for_status()
         
-        data = response.json()
+        data = orjson.loads(response.content)
         
         print(f"\nResponse status: {response.status_code}")
         
@@ -43,15 +52,11 @@ def simple_debug():
         
         if len(word_by_word) > 0:
             print("\nFirst few word-by-word entries:")
-            count = 0
-            for key, value in word_by_word.items():
-                if count >= 3:
-                    break
+            for value in islice(word_by_word.values(), 3):
                 style = value.get('style', '')
                 source = value.get('source', '')
                 spanish = value.get('spanish', '')
                 print(f"  {style}: {source} -> {spanish}")
-                count += 1
         
         print(f"\nTranslations:")
         for key, value in translations.items():
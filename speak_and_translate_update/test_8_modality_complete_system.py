@@ -52,7 +52,7 @@ class EightModalityTestSuite:
         self.test_sentence = "Ananassaft für das Mädchen und Brombeersaft für die Dame weil sie im Krankenhaus sind."
         self.results = []
         
-    async def run_all_8_modality_tests(self) -> Dict[str, Any]:
+    async def run_all_8_modality_tests(self, concurrency: int = 1) -> Dict[str, Any]:
         """Run comprehensive tests for all 8 modalities"""
         
         print("\n" + "="*100)
@@ -86,15 +86,25 @@ class EightModalityTestSuite:
             {"name": "All 8 Modalities + Audio", "german_native": True, "german_colloquial": True, "german_informal": True, "german_formal": True, "english_native": True, "english_colloquial": True, "english_informal": True, "english_formal": True, "german_word_by_word": True, "english_word_by_word": True}
         ]
         
-        total_start = time.time()
+        total_start = time.perf_counter()
         
-        for i, scenario in enumerate(test_scenarios):
-            await self._test_single_scenario(i + 1, scenario)
-            
-            # Brief pause between tests
-            await asyncio.sleep(0.5)
+        # Scenarios are independent and may run concurrently, but by default they run
+        # one at a time: with concurrency > 1 each processing_time also includes waiting
+        # on the other scenarios for the shared Gemini quota, which skews the 5-second
+        # fast_response check
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run_scenario(test_num: int, scenario: Dict[str, Any]):
+            async with semaphore:
+                await self._test_single_scenario(test_num, scenario)
+                
+                # Brief pause between tests
+                await asyncio.sleep(0.5)
+        
+        await asyncio.gather(*(run_scenario(i + 1, scenario) for i, scenario in enumerate(test_scenarios)))
+        self.results.sort(key=lambda r: r["test_num"])
         
-        total_time = time.time() - total_start
+        total_time = time.perf_counter() - total_start
         
         # Generate comprehensive report
         return self._generate_test_report(total_time)
@@ -104,9 +114,6 @@ class EightModalityTestSuite:
         
         scenario_name = scenario_config.pop("name")
         
-        print(f"\n🧪 TEST {test_num}: {scenario_name}")
-        print("-" * 60)
-        
         # Create style preferences
         prefs = StylePreferences(**scenario_config)
         
@@ -116,10 +123,7 @@ class EightModalityTestSuite:
             prefs.english_native, prefs.english_colloquial, prefs.english_informal, prefs.english_formal
         ])
         
-        print(f"   Expected modalities: {expected_modalities}")
-        print(f"   Audio settings: German={prefs.german_word_by_word}, English={prefs.english_word_by_word}")
-        
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Process translation
@@ -131,26 +135,30 @@ class EightModalityTestSuite:
                 mother_tongue="spanish"
             )
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Analyze results
             analysis = self._analyze_test_result(result, expected_modalities, prefs, processing_time)
             
-            # Display results
+            # Display results (after the await, so concurrent scenarios don't interleave)
+            self._display_scenario_header(test_num, scenario_name, expected_modalities, prefs)
             self._display_test_results(analysis, scenario_name)
             
             self.results.append({
+                "test_num": test_num,
                 "test_name": scenario_name,
                 "analysis": analysis,
                 "processing_time": processing_time
             })
             
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
+            self._display_scenario_header(test_num, scenario_name, expected_modalities, prefs)
             print(f"   ❌ TEST FAILED: {e}")
             
             self.results.append({
+                "test_num": test_num,
                 "test_name": scenario_name,
                 "analysis": {"success": False, "error": str(e)},
                 "processing_time": processing_time
@@ -230,24 +238,38 @@ class EightModalityTestSuite:
         
         return analysis
     
+    def _display_scenario_header(self, test_num: int, scenario_name: str, expected_modalities: int, prefs: StylePreferences):
+        """Display the scenario heading and its expectations"""
+        
+        print("\n".join([
+            f"\n🧪 TEST {test_num}: {scenario_name}",
+            "-" * 60,
+            f"   Expected modalities: {expected_modalities}",
+            f"   Audio settings: German={prefs.german_word_by_word}, English={prefs.english_word_by_word}",
+        ]))
+    
     def _display_test_results(self, analysis: Dict[str, Any], test_name: str):
         """Display test results"""
         
         status = "✅ PASS" if analysis["success"] else "❌ FAIL"
-        print(f"   {status}")
         
-        print(f"   Processing time: {analysis['processing_time']:.2f}s ({'FAST' if analysis['fast_response'] else 'SLOW'})")
-        print(f"   Modalities: {analysis['modalities_generated']}")
-        print(f"   Word-by-word: {'✅ Generated' if analysis['word_by_word_generated'] else '❌ Missing'}")
-        print(f"   Compound words: {'✅ Handled' if analysis['compound_word_handled'] else '❌ Not handled'}")
+        # Build the block and print it once instead of line by line
+        lines = [
+            f"   {status}",
+            f"   Processing time: {analysis['processing_time']:.2f}s ({'FAST' if analysis['fast_response'] else 'SLOW'})",
+            f"   Modalities: {analysis['modalities_generated']}",
+            f"   Word-by-word: {'✅ Generated' if analysis['word_by_word_generated'] else '❌ Missing'}",
+            f"   Compound words: {'✅ Handled' if analysis['compound_word_handled'] else '❌ Not handled'}",
+        ]
         
         if analysis["confidence_scores"]:
-            print(f"   Confidence: {analysis['avg_confidence']:.2f} avg ({'✅ Compliant' if analysis['confidence_compliant'] else '❌ Non-compliant'})")
+            lines.append(f"   Confidence: {analysis['avg_confidence']:.2f} avg ({'✅ Compliant' if analysis['confidence_compliant'] else '❌ Non-compliant'})")
         
         if analysis["errors"]:
-            print(f"   Errors:")
-            for error in analysis["errors"]:
-                print(f"     - {error}")
+            lines.append(f"   Errors:")
+            lines.extend(f"     - {error}" for error in analysis["errors"])
+        
+        print("\n".join(lines))
     
     def _generate_test_report(self, total_time: float) -> Dict[str, Any]:
         """Generate comprehensive test report"""
@@ -256,28 +278,12 @@ class EightModalityTestSuite:
         successful_tests = len([r for r in self.results if r["analysis"]["success"]])
         failed_tests = total_tests - successful_tests
         
-        print(f"\n" + "="*100)
-        print("🏆 8-MODALITY SYSTEM TEST REPORT")
-        print("="*100)
-        
-        print(f"Total tests: {total_tests}")
-        print(f"Successful: {successful_tests}")
-        print(f"Failed: {failed_tests}")
-        print(f"Success rate: {successful_tests/total_tests:.1%}")
-        print(f"Total testing time: {total_time:.2f}s")
-        
         # Key requirements check
         word_by_word_always = all(r["analysis"]["word_by_word_generated"] for r in self.results)
         confidence_compliant = all(r["analysis"]["confidence_compliant"] for r in self.results if r["analysis"]["confidence_scores"])
         fast_responses = sum(1 for r in self.results if r["analysis"]["fast_response"])
         compound_handling = any(r["analysis"]["compound_word_handled"] for r in self.results)
         
-        print(f"\n🎯 KEY REQUIREMENTS:")
-        print(f"   Word-by-word ALWAYS generated: {'✅ YES' if word_by_word_always else '❌ NO'}")
-        print(f"   Confidence 0.80-1.00 compliant: {'✅ YES' if confidence_compliant else '❌ NO'}")
-        print(f"   Fast responses (≤5s): {fast_responses}/{total_tests}")
-        print(f"   German compound words: {'✅ Handled' if compound_handling else '❌ Not handled'}")
-        
         # Overall system assessment
         overall_compliant = (
             successful_tests >= total_tests * 0.9 and  # 90%+ success rate
@@ -286,7 +292,22 @@ class EightModalityTestSuite:
             fast_responses >= total_tests * 0.8  # 80%+ fast responses
         )
         
-        print(f"\n🚀 OVERALL 8-MODALITY SYSTEM: {'✅ READY FOR PRODUCTION' if overall_compliant else '❌ NEEDS FIXES'}")
+        print("\n".join([
+            f"\n" + "="*100,
+            "🏆 8-MODALITY SYSTEM TEST REPORT",
+            "="*100,
+            f"Total tests: {total_tests}",
+            f"Successful: {successful_tests}",
+            f"Failed: {failed_tests}",
+            f"Success rate: {successful_tests/total_tests:.1%}",
+            f"Total testing time: {total_time:.2f}s",
+            f"\n🎯 KEY REQUIREMENTS:",
+            f"   Word-by-word ALWAYS generated: {'✅ YES' if word_by_word_always else '❌ NO'}",
+            f"   Confidence 0.80-1.00 compliant: {'✅ YES' if confidence_compliant else '❌ NO'}",
+            f"   Fast responses (≤5s): {fast_responses}/{total_tests}",
+            f"   German compound words: {'✅ Handled' if compound_handling else '❌ Not handled'}",
+            f"\n🚀 OVERALL 8-MODALITY SYSTEM: {'✅ READY FOR PRODUCTION' if overall_compliant else '❌ NEEDS FIXES'}",
+        ]))
         
         return {
             "total_tests": total_tests,